@@ -1,3 +1,5 @@
+import time
+
 from server.server import HTTPServer, Response, HTTPError
 
 server = HTTPServer(port=8080, log_level='DEBUG', max_request_size=16384)
@@ -30,7 +32,14 @@ def api_data(query_params, headers, body):
 
 @server.route('/static/style.css', methods=['GET'])
 def serve_css(query_params, headers, body):
-    return HTTPServer.serve_file('static/style.css', 'text/css')
+    return HTTPServer.serve_file('static/style.css', 'text/css', headers)
+
+clock = server.add_event_source('/events')
+
+def broadcast_time():
+    clock.broadcast('time', {'now': time.time()})
+
+server.add_ticker(1.0, broadcast_time)
 
 if __name__ == '__main__':
     server.start()
\ No newline at end of file
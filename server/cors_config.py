@@ -8,6 +8,10 @@ class CORSConfig:
         allow_headers (list[str], optional): List of allowed headers. Defaults to ["Content-Type"].
         allow_credentials (bool, optional): Whether to allow credentials. Defaults to False.
         max_age (int, optional): Maximum age of the CORS policy. Defaults to None.
+
+    The origin set and the joined method/header strings are precomputed
+    here so per-response CORS handling is a set lookup and a dict store
+    instead of list scans and ', '.join calls.
     """
     def __init__(
         self,
@@ -21,4 +25,15 @@ class CORSConfig:
         self.allow_methods = allow_methods or ["GET", "POST", "OPTIONS"]
         self.allow_headers = allow_headers or ["Content-Type"]
         self.allow_credentials = allow_credentials
-        self.max_age = max_age
\ No newline at end of file
+        self.max_age = max_age
+        self._allow_all_origins = self.allow_origins == ["*"]
+        self._origins_set = frozenset(self.allow_origins)
+        self._methods_joined = ", ".join(self.allow_methods)
+        self._headers_joined = ", ".join(self.allow_headers)
+        self._max_age_str = str(max_age) if max_age is not None else None
+        # True only when the caller configured something explicitly; a
+        # default-constructed config means CORS is effectively disabled
+        # and the server skips CORS work entirely.
+        self._configured = any(
+            [allow_origins, allow_methods, allow_headers, allow_credentials, max_age]
+        )
\ No newline at end of file
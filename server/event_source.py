@@ -0,0 +1,117 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class EventSource:
+    """
+    A server-sent events (SSE) stream that fans out messages to every
+    subscribed client.
+
+    An event source is registered with a server via
+    HTTPServer.add_event_source(path, event_source); GET requests for
+    that path are switched into streaming mode and stay open until the
+    client disconnects.
+
+    Attributes:
+        clients (list): The subscribed client sockets.
+
+    Methods:
+        attach(server): Bind this event source to a server's event loop.
+        add_client(conn): Subscribe a connection to this stream.
+        remove_client(conn): Unsubscribe a connection.
+        format_sse_message(event, data): Encode an SSE frame as bytes.
+        broadcast(event, data): Send an event to every subscribed client.
+    """
+
+    def __init__(self):
+        self.clients = []
+        self._server = None
+        self._prefix_cache = {}
+
+    def attach(self, server):
+        """
+        Binds this event source to a server so broadcasts can use the
+        server's non-blocking send path.
+
+        Args:
+            server (HTTPServer): The server driving the event loop.
+        """
+        self._server = server
+
+    def add_client(self, conn):
+        """
+        Subscribes a connection to this stream.
+
+        Args:
+            conn (socket): The client socket connection.
+        """
+        if conn not in self.clients:
+            self.clients.append(conn)
+
+    def remove_client(self, conn):
+        """
+        Unsubscribes a connection from this stream.
+
+        Args:
+            conn (socket): The client socket connection.
+        """
+        try:
+            self.clients.remove(conn)
+        except ValueError:
+            pass
+
+    def format_sse_message(self, event, data):
+        """
+        Encodes a server-sent events frame.
+
+        The 'event: <name>\\ndata: ' prefix is cached per event name, so
+        repeated broadcasts of the same event only encode the payload.
+
+        Args:
+            event (str): The event name.
+            data (str, bytes, or dict): The event payload. A dict is
+                serialized as JSON; bytes are used as-is.
+
+        Returns:
+            bytes: The encoded SSE frame.
+        """
+        prefix = self._prefix_cache.get(event)
+        if prefix is None:
+            prefix = f"event: {event}\ndata: ".encode("utf-8")
+            self._prefix_cache[event] = prefix
+        if isinstance(data, dict):
+            if orjson is not None:
+                data = orjson.dumps(data)
+            else:
+                data = json.dumps(data).encode("utf-8")
+        elif not isinstance(data, bytes):
+            data = str(data).encode("utf-8")
+        return prefix + data + b"\n\n"
+
+    def broadcast(self, event, data):
+        """
+        Sends an event to every subscribed client.
+
+        The frame is encoded once and shared across all clients as a
+        memoryview. Sends are non-blocking: a client whose socket buffer
+        is full has the remainder queued with the server's event loop,
+        so one slow client never holds up the rest of the fanout.
+
+        Args:
+            event (str): The event name.
+            data (str): The event payload.
+        """
+        message = self.format_sse_message(event, data)
+        view = memoryview(message)
+        for client in list(self.clients):
+            if self._server is not None:
+                if not self._server.send_stream_data(client, view):
+                    self.remove_client(client)
+            else:
+                try:
+                    client.sendall(message)
+                except OSError:
+                    self.remove_client(client)
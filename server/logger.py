@@ -10,26 +10,29 @@ class Logger:
 
     Methods:
         __init__(self, level="INFO"): Initializes a Logger object with the specified log level.
-        log(self, level, message): Logs a message with the specified log level.
-        debug(self, message): Logs a debug message.
-        info(self, message): Logs an info message.
-        warning(self, message): Logs a warning message.
-        error(self, message): Logs an error message.
-        critical(self, message): Logs a critical message.
+        log(self, level_value, level_name, message, args): Logs a message with the specified log level.
+        debug(self, message, *args): Logs a debug message.
+        info(self, message, *args): Logs an info message.
+        warning(self, message, *args): Logs a warning message.
+        error(self, message, *args): Logs an error message.
+        critical(self, message, *args): Logs a critical message.
     """
     LEVELS = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
 
     def __init__(self, level="INFO"):
         self.level = self.LEVELS[level]
 
-    def log(self, level, message):
-        if self.LEVELS[level] >= self.level:
-            timestamp = time.localtime()
-            print(
-                f"{timestamp[0]}-{timestamp[1]:02d}-{timestamp[2]:02d} {timestamp[3]:02d}:{timestamp[4]:02d}:{timestamp[5]:02d} [{level}] {message}"
-            )
-
-    def debug(self, message):
+    def log(self, level_value, level_name, message, args=()):
+        if level_value < self.level:
+            return
+        # Interpolation happens only after the level gate, so suppressed
+        # messages cost a single comparison.
+        if args:
+            message = message % args
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        print(f"{timestamp} [{level_name}] {message}")
+
+    def debug(self, message, *args):
         """
         Logs a debug message.
 
@@ -39,9 +42,9 @@ class Logger:
         Returns:
         - None
         """
-        self.log("DEBUG", message)
+        self.log(0, "DEBUG", message, args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """
         Logs an informational message.
 
@@ -51,27 +54,27 @@ class Logger:
         Returns:
             None
         """
-        self.log("INFO", message)
+        self.log(1, "INFO", message, args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """
         Logs a warning message.
 
         Parameters:
         - message (str): The warning message to be logged.
         """
-        self.log("WARNING", message)
+        self.log(2, "WARNING", message, args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """
         Logs an error message.
 
         Parameters:
             message (str): The error message to be logged.
         """
-        self.log("ERROR", message)
+        self.log(3, "ERROR", message, args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """
         Log a critical message.
 
@@ -81,4 +84,4 @@ class Logger:
         Returns:
         - None
         """
-        self.log("CRITICAL", message)
\ No newline at end of file
+        self.log(4, "CRITICAL", message, args)
\ No newline at end of file
@@ -1,4 +1,41 @@
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_REASON_PHRASES = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Request Entity Too Large",
+    500: "Internal Server Error",
+}
+
+_STATUS_LINES = {
+    code: f"HTTP/1.1 {code} {phrase}\r\n".encode("utf-8")
+    for code, phrase in _REASON_PHRASES.items()
+}
+
+_PRELUDE_CACHE = {}
+
+def _status_line(status_code):
+    """
+    Returns the encoded status line for a status code, falling back to
+    an 'Unknown' reason phrase for codes outside the precomputed table.
+    """
+    line = _STATUS_LINES.get(status_code)
+    if line is None:
+        line = f"HTTP/1.1 {status_code} Unknown\r\n".encode("utf-8")
+    return line
 
 class HTTPError(Exception):
     """
@@ -22,7 +59,7 @@ class Response:
     Initializes a Response object.
 
     Args:
-        body (str, optional): The response body. Defaults to "".
+        body (str, bytes, or dict, optional): The response body. Defaults to "".
         status_code (int, optional): The HTTP status code. Defaults to 200.
         headers (dict, optional): The response headers. Defaults to None.
 
@@ -72,19 +109,79 @@ class Response:
         Returns:
         None
         """
-        if cors_config.allow_origins == ["*"] or origin in cors_config.allow_origins:
+        if cors_config._allow_all_origins or origin in cors_config._origins_set:
             self.headers["Access-Control-Allow-Origin"] = origin
         if cors_config.allow_credentials:
             self.headers["Access-Control-Allow-Credentials"] = "true"
         if self.status_code == 204:  # Preflight response
-            self.headers["Access-Control-Allow-Methods"] = ", ".join(
-                cors_config.allow_methods
+            self.headers["Access-Control-Allow-Methods"] = cors_config._methods_joined
+            self.headers.setdefault(
+                "Access-Control-Allow-Headers", cors_config._headers_joined
             )
-            self.headers["Access-Control-Allow-Headers"] = ", ".join(
-                cors_config.allow_headers
+            # Without a max age browsers re-preflight every request; a
+            # day is the conventional cap when none is configured.
+            self.headers["Access-Control-Max-Age"] = (
+                cors_config._max_age_str or "86400"
             )
-            if cors_config.max_age is not None:
-                self.headers["Access-Control-Max-Age"] = str(cors_config.max_age)
+
+    def to_parts(self):
+        """
+        Builds the response as separate header and body buffers.
+
+        For the common case of a response whose only header is
+        Content-Type, the status line and static headers are cached as a
+        prebuilt bytes prelude keyed by (status_code, content_type), so
+        repeat responses skip the per-call string formatting and join.
+
+        Keeping the header block and body separate lets the server send
+        them with a single gathering sendmsg() call instead of
+        concatenating them into one large buffer first.
+
+        Returns:
+            tuple: The header block (bytes, including the terminating
+            blank line) and the body (bytes).
+        """
+        if isinstance(self.body, dict):
+            if orjson is not None:
+                body = orjson.dumps(self.body)
+            else:
+                body = json.dumps(self.body).encode("utf-8")
+        elif isinstance(self.body, (bytes, bytearray)):
+            body = self.body
+        else:
+            body = self.body.encode("utf-8")
+
+        if len(self.headers) == 1 and "Content-Type" in self.headers:
+            key = (self.status_code, self.headers["Content-Type"])
+            prelude = _PRELUDE_CACHE.get(key)
+            if prelude is None:
+                prelude = _status_line(self.status_code) + (
+                    f"Content-Type: {key[1]}\r\n"
+                    "Server: MicroPython-HTTPServer\r\n"
+                ).encode("utf-8")
+                _PRELUDE_CACHE[key] = prelude
+            return (prelude + b"Content-Length: %d\r\n\r\n" % len(body), body)
+
+        return self._compose_head(len(body)), body
+
+    def _compose_head(self, body_length):
+        """
+        Builds the full header block for this response as bytes.
+
+        Args:
+            body_length (int): The value for the Content-Length header.
+
+        Returns:
+            bytes: The header block including the terminating blank line.
+        """
+        head = bytearray(_status_line(self.status_code))
+        for name, value in self.headers.items():
+            head += name.encode("latin-1")
+            head += b": "
+            head += str(value).encode("latin-1")
+            head += b"\r\n"
+        head += b"Content-Length: %d\r\nServer: MicroPython-HTTPServer\r\n\r\n" % body_length
+        return bytes(head)
 
     def to_bytes(self):
         """
@@ -93,26 +190,38 @@ class Response:
         Returns:
             bytes: The HTTP response headers and body encoded as bytes.
         """
-        status_codes = {
-            200: "OK",
-            201: "Created",
-            204: "No Content",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            405: "Method Not Allowed",
-            500: "Internal Server Error",
-        }
-        status_text = status_codes.get(self.status_code, "Unknown")
+        head, body = self.to_parts()
+        return head + body
 
-        if isinstance(self.body, dict):
-            self.body = json.dumps(self.body)
+class FileResponse(Response):
+    """
+    A response whose body is streamed from a file with sendfile(2).
 
-        headers = [f"HTTP/1.1 {self.status_code} {status_text}"]
-        headers.extend([f"{k}: {v}" for k, v in self.headers.items()])
-        headers.append(f"Content-Length: {len(self.body)}")
-        headers.append("Server: MicroPython-HTTPServer")
-        headers.append("\r\n")
+    Instead of reading the file into Python memory, the server sends the
+    header block and then hands the file descriptor to the kernel, which
+    copies pages from the page cache straight to the socket without the
+    bytes ever entering user space.
 
-        return "\r\n".join(headers).encode("utf-8") + self.body.encode("utf-8")
\ No newline at end of file
+    Args:
+        file_path (str): The path of the file to serve.
+        content_type (str): The content type of the file.
+        status_code (int, optional): The HTTP status code. Defaults to 200.
+        headers (dict, optional): Extra response headers. Defaults to None.
+    """
+
+    def __init__(self, file_path, content_type, status_code=200, headers=None):
+        self.file_path = file_path
+        self.content_length = os.path.getsize(file_path)
+        headers = headers or {}
+        headers.setdefault("Content-Type", content_type)
+        super().__init__("", status_code=status_code, headers=headers)
+
+    def to_parts(self):
+        """
+        Builds the header block; the file body is streamed separately by
+        the server.
+
+        Returns:
+            tuple: The header block (bytes) and an empty body.
+        """
+        return self._compose_head(self.content_length), b""
\ No newline at end of file
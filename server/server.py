@@ -1,8 +1,62 @@
+import functools
+import os
+import re
 import socket
+import sys
+import selectors
 import json
+import time
+from urllib.parse import parse_qs
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .logger import Logger
-from .response import Response, HTTPError
+from .response import Response, FileResponse, HTTPError
 from .cors_config import CORSConfig
+from .event_source import EventSource
+
+_STATIC_CACHE = {}
+
+_REQUEST_LINE_RE = re.compile(rb"([A-Za-z]+) ([^ \r\n]+) HTTP/\d\.\d$")
+
+@functools.lru_cache(maxsize=1024)
+def _parse_query_string(query_string):
+    """
+    Parses a query string into a dict, memoized per distinct string.
+
+    Clients tend to repeat identical query strings, so the parse runs
+    once per distinct string. Multi-value entries are stored as tuples
+    so nothing mutable is shared with the cache; parse_query_string
+    converts them back to the lists handlers expect.
+    """
+    return {
+        key: values[0] if len(values) == 1 else tuple(values)
+        for key, values in parse_qs(query_string, keep_blank_values=True).items()
+    }
+
+# Raw header-name bytes -> normalized lowercase name. Clients send the
+# same canonical spellings on every request, so after the first request
+# each name is one dict hit instead of a strip/decode/lower chain. The
+# cache is bounded so unusual spellings cannot grow it without limit.
+_HEADER_NAME_CACHE = {}
+_HEADER_NAME_CACHE_MAX = 256
+
+# Interned copies of the header names the server itself looks up. The
+# parser interns every cached header name, so these .get() calls resolve
+# on an identity compare instead of hashing a 30-character string per
+# request.
+_ORIGIN = sys.intern("origin")
+_ACRM = sys.intern("access-control-request-method")
+_ACRH = sys.intern("access-control-request-headers")
+_CONTENT_LENGTH = sys.intern("content-length")
+_IF_NONE_MATCH = sys.intern("if-none-match")
+
+# Files larger than this are streamed with sendfile(2) rather than
+# cached in memory.
+_SENDFILE_THRESHOLD = 65536
 
 class HTTPServer:
     """
@@ -17,15 +71,19 @@ class HTTPServer:
     Attributes:
         port (int): The port number to listen on.
         socket (socket.socket): The server socket.
-        routes (dict): A dictionary of routes and their corresponding handlers.
         logger (Logger): The logger instance for logging server events.
         max_request_size (int): The maximum size of a request in bytes.
         cors_config (CORSConfig): The CORS configuration.
 
     Methods:
-        start(): Start the server.
-        handle_request(conn): Handle an incoming request.
-        send_response(conn, response): Send a response to the client.
+        start(): Start the server and run the event loop.
+        accept_connection(): Accept a pending connection.
+        read_connection(conn): Read available data from a connection.
+        flush_connection(conn): Write queued response data to a connection.
+        handle_request(conn, request): Handle a fully received request.
+        send_response(conn, response): Queue a response for the client.
+        add_event_source(path, event_source): Register a server-sent events stream.
+        add_ticker(interval, callback): Register a periodic event-loop callback.
         handle_preflight(headers): Handle a preflight request.
         parse_request(request): Parse an HTTP request.
         parse_query_string(query_string): Parse a query string into a dictionary of parameters.
@@ -40,89 +98,332 @@ class HTTPServer:
     ):
         self.port = port
         self.socket = None
-        self.routes = {}
+        self._route_table = {}
+        self._paths = set()
         self.logger = Logger(log_level)
         self.max_request_size = max_request_size
         self.cors_config = cors_config or CORSConfig()
+        self.selector = None
+        self._buffers = {}
+        self._outbox = {}
+        self._event_sources = {}
+        self._streams = {}
+        self._tickers = []
+        self._files = {}
+        # Single-threaded loop, so one scratch buffer serves every recv.
+        self._scratch = bytearray(4096)
+        self._scratch_view = memoryview(self._scratch)
+        # Recycled request accumulators; closed connections return their
+        # buffer here so busy servers stop allocating one per connection.
+        self._buffer_pool = []
+        # conn -> (header_end, total expected bytes), cached once the
+        # header terminator has been located.
+        self._framing = {}
+        # method -> [route specs, compiled alternation regex, slot table]
+        # for parametric routes; the regex is rebuilt lazily after
+        # registration so dispatch stays one match call per request.
+        self._param_routes = {}
 
-    def start(self):
+    def start(self, workers=1):
         """
-        Starts the server and listens for incoming connections on the specified port.
+        Starts the server and serves connections from a single event loop
+        per worker process.
+
+        The listening socket and every accepted connection are non-blocking
+        and registered with a selector (epoll on Linux), so one slow client
+        never stalls the others.
+
+        Args:
+            workers (int): The number of worker processes to run. When
+                greater than one (and the platform supports fork), each
+                forked worker binds its own SO_REUSEPORT socket to the
+                port, giving it a private kernel accept queue that the
+                kernel load-balances across, scaling past the
+                single-core limit of one interpreter without waking
+                every worker per connection. Where SO_REUSEPORT is
+                unavailable, workers fall back to draining the shared
+                inherited socket. Note that event source clients are
+                per-worker.
 
         Raises:
             Exception: If there is an error starting the server.
         """
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.bind(("0.0.0.0", self.port))
-            self.socket.listen(5)
-            self.logger.info(f"Server started on port {self.port}")
+            use_reuseport = workers > 1 and hasattr(socket, "SO_REUSEPORT")
+            self.socket = self._bind_listen_socket(use_reuseport)
+            if workers > 1 and hasattr(os, "fork"):
+                for _ in range(workers - 1):
+                    if os.fork() == 0:
+                        if use_reuseport:
+                            # A socket of the worker's own gets a private
+                            # kernel accept queue; sharing the inherited
+                            # fd would wake every worker's selector on
+                            # each connection.
+                            self.socket.close()
+                            self.socket = self._bind_listen_socket(True)
+                        break
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_READ)
+            self.logger.info("Server started on port %s", self.port)
+
+            # Bind the per-iteration lookups to locals; attribute and
+            # global loads inside the loop are measurable at this rate.
+            select = self.selector.select
+            listen_socket = self.socket
+            accept_connection = self.accept_connection
+            flush_connection = self.flush_connection
+            read_connection = self.read_connection
+            event_write = selectors.EVENT_WRITE
+            tickers = self._tickers
+            run_tickers = self.run_tickers
 
             while True:
-                conn, addr = self.socket.accept()
-                self.logger.info(f"New connection from {addr}")
-                try:
-                    self.handle_request(conn)
-                except Exception as e:
-                    self.logger.error(f"Error handling request: {str(e)}")
-                finally:
-                    conn.close()
+                timeout = None
+                if tickers:
+                    timeout = max(
+                        0, min(ticker[0] for ticker in tickers) - time.monotonic()
+                    )
+                events = select(timeout)
+                for key, mask in events:
+                    fileobj = key.fileobj
+                    if fileobj is listen_socket:
+                        accept_connection()
+                    elif mask & event_write:
+                        flush_connection(fileobj)
+                    else:
+                        read_connection(fileobj)
+                if tickers:
+                    run_tickers()
         except Exception as e:
-            self.logger.critical(f"Server error: {str(e)}")
+            self.logger.critical("Server error: %s", e)
         finally:
+            if self.selector:
+                self.selector.close()
             if self.socket:
                 self.socket.close()
 
-    def handle_request(self, conn):
+    def _bind_listen_socket(self, use_reuseport):
         """
-        Handles an incoming HTTP request.
+        Creates, binds, and starts listening on a non-blocking socket.
 
         Args:
-            conn (socket): The socket connection for the request.
-
-        Raises:
-            HTTPError: If the request entity is too large (413 status code).
-            Exception: If an unexpected error occurs.
+            use_reuseport (bool): Whether to set SO_REUSEPORT, which must
+                happen before bind() for the kernel to balance accepts
+                across the sockets sharing the port.
 
         Returns:
-            None
+            socket.socket: The listening socket.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if use_reuseport:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(("0.0.0.0", self.port))
+        sock.listen(1024)
+        sock.setblocking(False)
+        return sock
+
+    def accept_connection(self):
+        """
+        Accepts every pending connection and registers them with the
+        selector.
+
+        The backlog is drained in a loop so a burst of connections costs
+        one selector wakeup rather than one per accept.
+        """
+        while True:
+            try:
+                conn, addr = self.socket.accept()
+            except (BlockingIOError, OSError):
+                return
+            self.logger.info("New connection from %s", addr)
+            conn.setblocking(False)
+            # Disable Nagle; responses are written in one gathered call,
+            # so there is nothing to coalesce and the delayed-ACK
+            # interaction only adds latency to small responses.
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            pool = self._buffer_pool
+            self._buffers[conn] = pool.pop() if pool else bytearray()
+            self.selector.register(conn, selectors.EVENT_READ)
 
+    def read_connection(self, conn):
         """
+        Drains available data from a connection and dispatches the request
+        once it has been fully received.
+
+        Args:
+            conn (socket): The readable socket connection.
+        """
+        if conn in self._streams:
+            try:
+                while conn.recv(4096):
+                    pass
+            except BlockingIOError:
+                return
+            except OSError:
+                pass
+            self.close_connection(conn)
+            return
+
+        buffer = self._buffers.get(conn)
+        if buffer is None:
+            buffer = self._buffers[conn] = bytearray()
+        scratch = self._scratch
+        scratch_view = self._scratch_view
+        already = len(buffer)
+        eof = False
         try:
-            request = b""
             while True:
-                chunk = conn.recv(4096)
-                request += chunk
-                if len(chunk) < 4096:
+                received = conn.recv_into(scratch)
+                if not received:
+                    # The client half-closed its side; a complete request
+                    # may already be buffered, so fall through to the
+                    # framing check instead of discarding it.
+                    eof = True
                     break
-                if len(request) > self.max_request_size:
+                buffer += scratch_view[:received]
+                if len(buffer) > self.max_request_size:
                     raise HTTPError(413, "Request Entity Too Large")
+        except BlockingIOError:
+            pass
+        except HTTPError as e:
+            self.logger.warning("HTTP Error %s: %s", e.status_code, e.message)
+            del buffer[:]
+            self._framing.pop(conn, None)
+            error_response = Response({"error": e.message}, status_code=e.status_code)
+            self.send_response(conn, error_response)
+            return
+        except OSError:
+            self.close_connection(conn)
+            return
 
-            if not request:
+        framing = self._framing.get(conn)
+        if framing is None:
+            # Resume the terminator scan just before where the previous
+            # read ended, so each byte is scanned once.
+            search_start = already - 3 if already > 3 else 0
+            header_end = buffer.find(b"\r\n\r\n", search_start)
+            if header_end == -1:
+                if eof:
+                    self.close_connection(conn)
                 return
+            total = header_end + 4 + self.parse_content_length(buffer, header_end)
+            framing = (header_end, total)
+            self._framing[conn] = framing
+        if len(buffer) < framing[1]:
+            if eof:
+                self.close_connection(conn)
+            return
 
-            request = request.decode("utf-8")
-            method, path, query_params, headers, body = self.parse_request(request)
+        self._framing.pop(conn, None)
+        pool = self._buffer_pool
+        self._buffers[conn] = pool.pop() if pool else bytearray()
+        self.handle_request(conn, buffer, framing[0], framing[1])
+        # parse_request copies every slice it keeps, so the request
+        # buffer can go straight back into the pool.
+        if len(pool) < 32:
+            del buffer[:]
+            pool.append(buffer)
 
-            self.logger.info(f"Received {method} request for {path}")
+    def parse_content_length(self, buffer, header_end):
+        """
+        Extracts the Content-Length value from a buffered header block.
+
+        Args:
+            buffer (bytes): The request data received so far.
+            header_end (int): The offset of the header terminator.
+
+        Returns:
+            int: The declared body length, or 0 if absent or malformed.
+        """
+        head = buffer[:header_end].lower()
+        # Anchor the match to the start of a header line; a bare find()
+        # would also hit names like X-Content-Length or the substring
+        # inside a header value. Every header line follows the
+        # request-line CRLF, so the marker always includes one.
+        marker = head.find(b"\r\ncontent-length:")
+        if marker == -1:
+            return 0
+        line_end = head.find(b"\r\n", marker + 2)
+        if line_end == -1:
+            line_end = header_end
+        try:
+            return int(head[marker + 17 : line_end])
+        except ValueError:
+            return 0
+
+    def close_connection(self, conn):
+        """
+        Unregisters a connection from the selector and closes it.
+
+        Args:
+            conn (socket): The socket connection to close.
+        """
+        try:
+            self.selector.unregister(conn)
+        except (KeyError, ValueError):
+            pass
+        buffer = self._buffers.pop(conn, None)
+        if buffer is not None and len(self._buffer_pool) < 32:
+            del buffer[:]
+            self._buffer_pool.append(buffer)
+        self._outbox.pop(conn, None)
+        self._framing.pop(conn, None)
+        file_state = self._files.pop(conn, None)
+        if file_state is not None:
+            file_state[0].close()
+        event_source = self._streams.pop(conn, None)
+        if event_source is not None:
+            event_source.remove_client(conn)
+        conn.close()
+
+    def handle_request(self, conn, request, header_end=-1, total=-1):
+        """
+        Handles a fully received HTTP request.
+
+        Args:
+            conn (socket): The socket connection for the request.
+            request (bytes): The raw request data.
+            header_end (int): The offset of the header terminator, if the
+                caller has already located it. Defaults to -1 (unknown).
+            total (int): The framed length of the request (headers plus
+                declared body), if known. Defaults to -1 (unknown).
+
+        Raises:
+            HTTPError: If the request is malformed.
+            Exception: If an unexpected error occurs.
+
+        Returns:
+            None
+
+        """
+        try:
+            method, path, query_params, headers, body = self.parse_request(
+                request, header_end, total
+            )
+
+            self.logger.info("Received %s request for %s", method, path)
 
             if method == "OPTIONS":
                 response = self.handle_preflight(headers)
                 self.send_response(conn, response)
+            elif method == "GET" and path in self._event_sources:
+                self.start_stream(conn, self._event_sources[path])
             else:
                 response = self.process_request(
                     method, path, query_params, headers, body
                 )
-                origin = headers.get("origin")
-                if origin:
-                    response.add_cors_headers(self.cors_config, origin)
+                if self.cors_config._configured:
+                    origin = headers.get(_ORIGIN)
+                    if origin:
+                        response.add_cors_headers(self.cors_config, origin)
                 self.send_response(conn, response)
         except HTTPError as e:
-            self.logger.warning(f"HTTP Error {e.status_code}: {e.message}")
+            self.logger.warning("HTTP Error %s: %s", e.status_code, e.message)
             error_response = Response({"error": e.message}, status_code=e.status_code)
             self.send_response(conn, error_response)
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
+            self.logger.error("Unexpected error: %s", e)
             error_response = Response(
                 {"error": "Internal Server Error"}, status_code=500
             )
@@ -130,7 +431,10 @@ class HTTPServer:
 
     def send_response(self, conn, response):
         """
-        Sends the given response to the specified connection.
+        Queues the given response for the specified connection.
+
+        The data is written out by the event loop as the socket becomes
+        writable; the connection is closed once fully flushed.
 
         Parameters:
         - conn: The connection to send the response to.
@@ -139,7 +443,240 @@ class HTTPServer:
         Returns:
         None
         """
-        conn.send(response.to_bytes())
+        self._outbox[conn] = [memoryview(part) for part in response.to_parts() if part]
+        if isinstance(response, FileResponse):
+            try:
+                # [file object, file offset, bytes remaining]
+                self._files[conn] = [
+                    open(response.file_path, "rb"),
+                    0,
+                    response.content_length,
+                ]
+            except OSError:
+                self.close_connection(conn)
+                return
+        # Opportunistic immediate flush: the socket buffer is almost
+        # always empty, so most responses go out right here instead of
+        # waiting for another selector round trip.
+        self.flush_connection(conn)
+        if conn in self._outbox or conn in self._files:
+            try:
+                self.selector.modify(conn, selectors.EVENT_WRITE)
+            except (KeyError, ValueError):
+                self.close_connection(conn)
+
+    def flush_connection(self, conn):
+        """
+        Writes queued response data to a connection, closing it once the
+        response has been sent in full.
+
+        The header block and body are kept as separate buffers and handed
+        to sendmsg(), which gathers them in a single writev(2) syscall
+        without concatenating them in user space. Short writes advance
+        through the buffer list with memoryview slicing.
+
+        Args:
+            conn (socket): The writable socket connection.
+        """
+        parts = self._outbox.get(conn)
+        try:
+            while parts:
+                if hasattr(conn, "sendmsg"):
+                    sent = conn.sendmsg(parts)
+                else:
+                    sent = conn.send(parts[0])
+                while sent:
+                    first = parts[0]
+                    if sent >= len(first):
+                        sent -= len(first)
+                        parts.pop(0)
+                    else:
+                        parts[0] = first[sent:]
+                        sent = 0
+        except BlockingIOError:
+            return
+        except OSError:
+            self.close_connection(conn)
+            return
+        file_state = self._files.get(conn)
+        if file_state is not None:
+            try:
+                if not self.send_file_data(conn, file_state):
+                    return
+            except OSError:
+                self.close_connection(conn)
+                return
+            file_state[0].close()
+            self._files.pop(conn, None)
+        if conn in self._streams:
+            self._outbox.pop(conn, None)
+            try:
+                self.selector.modify(conn, selectors.EVENT_READ)
+            except (KeyError, ValueError):
+                self.close_connection(conn)
+            return
+        self.close_connection(conn)
+
+    def send_file_data(self, conn, file_state):
+        """
+        Streams file data to a connection with sendfile(2).
+
+        On platforms with os.sendfile, the kernel copies pages from the
+        page cache directly to the socket; the bytes never enter Python.
+        Elsewhere the file is relayed in chunks, with any short write
+        queued on the connection's outbox.
+
+        Args:
+            conn (socket): The writable socket connection.
+            file_state (list): The [file, offset, remaining] stream state.
+
+        Returns:
+            bool: True once the file has been fully streamed.
+        """
+        while file_state[2] > 0:
+            if hasattr(os, "sendfile"):
+                try:
+                    sent = os.sendfile(
+                        conn.fileno(),
+                        file_state[0].fileno(),
+                        file_state[1],
+                        min(file_state[2], 65536),
+                    )
+                except BlockingIOError:
+                    return False
+                if sent == 0:
+                    break
+                file_state[1] += sent
+                file_state[2] -= sent
+            else:
+                chunk = file_state[0].read(min(file_state[2], 65536))
+                if not chunk:
+                    break
+                file_state[2] -= len(chunk)
+                try:
+                    sent = conn.send(chunk)
+                except BlockingIOError:
+                    sent = 0
+                if sent < len(chunk):
+                    self._outbox.setdefault(conn, []).append(memoryview(chunk)[sent:])
+                    return False
+        return True
+
+    def add_ticker(self, interval, callback):
+        """
+        Registers a callback to run periodically on the event loop.
+
+        One ticker drives any number of stream subscribers — a single
+        callback broadcasting to an EventSource replaces a blocking
+        per-connection handler loop, so the cost of a periodic stream
+        stays constant regardless of how many clients are subscribed.
+
+        Args:
+            interval (float): The number of seconds between invocations.
+            callback (callable): Called with no arguments on each tick.
+
+        Returns:
+            callable: The registered callback.
+        """
+        self._tickers.append([time.monotonic() + interval, interval, callback])
+        return callback
+
+    def run_tickers(self):
+        """
+        Runs any periodic callbacks whose deadline has passed and
+        schedules their next invocation.
+        """
+        now = time.monotonic()
+        for ticker in self._tickers:
+            if ticker[0] <= now:
+                ticker[0] = now + ticker[1]
+                try:
+                    ticker[2]()
+                except Exception as e:
+                    self.logger.error("Ticker error: %s", e)
+
+    def add_event_source(self, path, event_source=None):
+        """
+        Registers an EventSource so GET requests for the given path are
+        served as a server-sent events stream.
+
+        Args:
+            path (str): The URL path for the stream.
+            event_source (EventSource, optional): The event source to
+                serve. A new one is created if not given.
+
+        Returns:
+            EventSource: The registered event source.
+        """
+        if event_source is None:
+            event_source = EventSource()
+        event_source.attach(self)
+        self._event_sources[path] = event_source
+        return event_source
+
+    def start_stream(self, conn, event_source):
+        """
+        Switches a connection into server-sent events streaming mode.
+
+        The SSE response headers are queued for sending and the
+        connection stays registered with the selector so broadcasts can
+        reach it and client disconnects are noticed; it is not closed
+        once the headers are flushed.
+
+        Args:
+            conn (socket): The socket connection to convert.
+            event_source (EventSource): The stream to subscribe it to.
+        """
+        self._streams[conn] = event_source
+        head = (
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: text/event-stream\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Connection: keep-alive\r\n"
+            "Server: MicroPython-HTTPServer\r\n\r\n"
+        ).encode("utf-8")
+        self._outbox[conn] = [memoryview(head)]
+        try:
+            self.selector.modify(conn, selectors.EVENT_WRITE)
+        except (KeyError, ValueError):
+            self.close_connection(conn)
+            return
+        event_source.add_client(conn)
+
+    def send_stream_data(self, conn, view):
+        """
+        Sends a frame to a streaming client without blocking.
+
+        Whatever the socket buffer cannot absorb immediately is queued
+        and flushed by the event loop once the socket becomes writable
+        again, preserving frame order.
+
+        Args:
+            conn (socket): The streaming client connection.
+            view (memoryview): The frame data to send.
+
+        Returns:
+            bool: False if the client has disconnected, True otherwise.
+        """
+        pending = self._outbox.get(conn)
+        if pending:
+            pending.append(view)
+            return True
+        try:
+            sent = conn.send(view)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self.close_connection(conn)
+            return False
+        if sent < len(view):
+            self._outbox[conn] = [view[sent:]]
+            try:
+                self.selector.modify(conn, selectors.EVENT_WRITE)
+            except (KeyError, ValueError):
+                self.close_connection(conn)
+                return False
+        return True
 
     def handle_preflight(self, headers):
         """
@@ -154,36 +691,73 @@ class HTTPServer:
         Raises:
             HTTPError: If the preflight request is invalid.
         """
-        requested_method = headers.get("access-control-request-method")
-        requested_headers = headers.get("access-control-request-headers")
+        requested_method = headers.get(_ACRM)
+        requested_headers = headers.get(_ACRH)
 
         if requested_method and requested_method in self.cors_config.allow_methods:
             response = Response("", status_code=204)  # No Content
             if requested_headers:
-                self.cors_config.allow_headers.extend(
-                    [h.strip() for h in requested_headers.split(",")]
-                )
+                response.headers["Access-Control-Allow-Headers"] = requested_headers
+            if self.cors_config._configured:
+                origin = headers.get(_ORIGIN)
+                if origin:
+                    response.add_cors_headers(self.cors_config, origin)
             return response
         else:
             raise HTTPError(400, "Invalid preflight request")
 
-    def parse_request(self, request):
+    def parse_request(self, request, header_end=-1, total=-1):
         """
         Parses the HTTP request and extracts the method, path, query parameters, headers, and body.
 
+        The raw bytes are scanned in place with index-based find() calls
+        instead of being decoded and split into a list of line strings;
+        only the request line, header fields, and body are materialized.
+        Header values are decoded as latin-1 per the HTTP specification.
+
         Args:
-            request (str): The HTTP request string.
+            request (bytes): The raw HTTP request data.
+            header_end (int): The offset of the header terminator, if the
+                framing code has already located it. Defaults to -1, in
+                which case it is found here.
+            total (int): The framed request length, bounding the body at
+                the declared Content-Length. Defaults to -1, in which
+                case the rest of the buffer is taken.
 
         Returns:
-            tuple: A tuple containing the method (str), path (str), query parameters (dict), headers (dict), and body (str).
+            tuple: A tuple containing the method (str), path (str), query parameters (dict), headers (dict), and body (bytes).
 
         Raises:
             HTTPError: If there is a bad request.
 
         """
         try:
-            lines = request.split("\r\n")
-            method, full_path, _ = lines[0].split()
+            if header_end < 0:
+                header_end = request.find(b"\r\n\r\n")
+            if header_end == -1:
+                header_end = len(request)
+                body = None
+            else:
+                # The body is handed to handlers as bytes; skipping the
+                # UTF-8 decode avoids validating payload bytes that many
+                # handlers (JSON, uploads) never need as text. The slice
+                # stops at the framed total so bytes past the declared
+                # Content-Length (e.g. a pipelined request) never leak
+                # into the body.
+                if total < 0:
+                    total = len(request)
+                body = bytes(request[header_end + 4 : total])
+
+            line_end = request.find(b"\r\n", 0, header_end)
+            if line_end == -1:
+                line_end = header_end
+            match = _REQUEST_LINE_RE.match(request, 0, line_end)
+            if match is None:
+                raise ValueError("malformed request line")
+            # Interned at registration time too, so dispatch compares by
+            # pointer instead of hashing the method string per request.
+            method = sys.intern(match.group(1).decode("latin-1"))
+            full_path = match.group(2).decode("latin-1")
 
             path, query = (
                 full_path.split("?", 1) if "?" in full_path else (full_path, "")
@@ -191,16 +765,23 @@ class HTTPServer:
             query_params = self.parse_query_string(query)
 
             headers = {}
-            body_start = 0
-            for i, line in enumerate(lines[1:]):
-                if not line:
-                    body_start = i + 2
-                    break
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    headers[key.strip().lower()] = value.strip()
-
-            body = "\r\n".join(lines[body_start:]) if body_start else None
+            pos = line_end + 2
+            while pos < header_end:
+                line_break = request.find(b"\r\n", pos, header_end)
+                if line_break == -1:
+                    line_break = header_end
+                colon = request.find(b":", pos, line_break)
+                if colon != -1:
+                    raw_key = bytes(request[pos:colon])
+                    key = _HEADER_NAME_CACHE.get(raw_key)
+                    if key is None:
+                        key = sys.intern(raw_key.strip().decode("latin-1").lower())
+                        if len(_HEADER_NAME_CACHE) < _HEADER_NAME_CACHE_MAX:
+                            _HEADER_NAME_CACHE[raw_key] = key
+                    headers[key] = request[colon + 1 : line_break].strip().decode(
+                        "latin-1"
+                    )
+                pos = line_break + 2
 
             return method, path, query_params, headers, body
         except Exception as e:
@@ -210,6 +791,12 @@ class HTTPServer:
         """
         Parses the given query string and returns a dictionary of parameters.
 
+        Parsing is delegated to urllib.parse.parse_qs, which also
+        percent-decodes values (the old hand-rolled loop did not).
+        Keys that appear once map to their single value; repeated keys
+        map to a list of values. Results are memoized per distinct query
+        string, since clients tend to repeat them request after request.
+
         Args:
             query_string (str): The query string to be parsed.
 
@@ -217,19 +804,14 @@ class HTTPServer:
             dict: A dictionary containing the parsed parameters.
 
         """
-        params = {}
-        if query_string:
-            pairs = query_string.split("&")
-            for pair in pairs:
-                key, value = pair.split("=", 1) if "=" in pair else (pair, "")
-                if key in params:
-                    if isinstance(params[key], list):
-                        params[key].append(value)
-                    else:
-                        params[key] = [params[key], value]
-                else:
-                    params[key] = value
-        return params
+        if not query_string:
+            return {}
+        # Fresh dict and fresh lists per call; handing out the cached
+        # containers would let handler mutations pollute later requests.
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in _parse_query_string(query_string).items()
+        }
 
     def process_request(self, method, path, query_params, headers, body):
         """
@@ -240,39 +822,110 @@ class HTTPServer:
             path (str): The path of the request.
             query_params (dict): The query parameters of the request.
             headers (dict): The headers of the request.
-            body (str): The body of the request.
+            body (bytes): The body of the request.
 
         Returns:
             The response generated by the request handler.
 
         Raises:
-            HTTPError: If the requested path and method combination is not found.
+            HTTPError: If the requested path is not found (404) or does not
+                allow the requested method (405).
         """
-        if path in self.routes and method in self.routes[path]:
-            handler = self.routes[path][method]
+        handler = self._route_table.get((path, method))
+        if handler is not None:
             return handler(query_params, headers, body)
-        else:
-            raise HTTPError(404, "Not Found")
+
+        entry = self._param_routes.get(method)
+        if entry is not None:
+            if entry[1] is None:
+                self._compile_param_routes(method)
+            match = entry[1].match(path)
+            if match is not None:
+                handler, param_names, first = entry[2][match.lastgroup]
+                groups = match.groups()
+                params = dict(
+                    zip(param_names, groups[first : first + len(param_names)])
+                )
+                return handler(query_params, headers, body, **params)
+
+        if path in self._paths:
+            raise HTTPError(405, "Method Not Allowed")
+        for other_method, other in self._param_routes.items():
+            if other_method == method:
+                continue
+            if other[1] is None:
+                self._compile_param_routes(other_method)
+            if other[1].match(path):
+                raise HTTPError(405, "Method Not Allowed")
+        raise HTTPError(404, "Not Found")
+
+    def _compile_param_routes(self, method):
+        """
+        Builds the alternation regex for a method's parametric routes.
+
+        Each route becomes one named alternative, so dispatch is a single
+        match call regardless of how many routes are registered; the slot
+        table maps the matched alternative back to its handler and the
+        positions of its parameter groups.
+
+        Args:
+            method (str): The HTTP method whose routes to compile.
+        """
+        entry = self._param_routes[method]
+        alternatives = []
+        slots = {}
+        group_number = 1
+        for index, (pattern, param_names, handler) in enumerate(entry[0]):
+            name = "r%d" % index
+            alternatives.append("(?P<%s>%s)" % (name, pattern))
+            # groups() is zero-based, so the alternative's own group
+            # number is the index of its first parameter group.
+            slots[name] = (handler, param_names, group_number)
+            group_number += 1 + len(param_names)
+        entry[1] = re.compile("^(?:" + "|".join(alternatives) + ")$")
+        entry[2] = slots
 
     def route(self, path, methods=None):
         """
         Decorator function for defining routes in the HTTP server.
 
+        Path segments starting with ':' declare parameters, e.g.
+        '/users/:user_id'; the matched values are passed to the handler
+        as keyword arguments after the usual (query_params, headers,
+        body) positionals. Literal paths keep their exact-match dict
+        lookup; parametric paths share one compiled regex per method.
+
         Parameters:
         - path (str): The URL path for the route.
         - methods (list, optional): The HTTP methods allowed for the route. Defaults to ["GET"].
 
         Returns:
-        - decorator (function): The decorator function that adds the route to the server's routes dictionary.
+        - decorator (function): The decorator function that adds the route to the server's route table.
         """
         if methods is None:
             methods = ["GET"]
 
         def decorator(handler):
-            if path not in self.routes:
-                self.routes[path] = {}
+            if ":" in path:
+                param_names = []
+                parts = []
+                for segment in path.split("/"):
+                    if segment.startswith(":") and len(segment) > 1:
+                        param_names.append(segment[1:])
+                        parts.append("([^/]+)")
+                    else:
+                        parts.append(re.escape(segment))
+                spec = ("/".join(parts), tuple(param_names), handler)
+                for method in methods:
+                    entry = self._param_routes.setdefault(
+                        sys.intern(method), [[], None, None]
+                    )
+                    entry[0].append(spec)
+                    entry[1] = None
+                return handler
             for method in methods:
-                self.routes[path][method] = handler
+                self._route_table[(path, sys.intern(method))] = handler
+            self._paths.add(path)
             return handler
 
         return decorator
@@ -300,13 +953,23 @@ class HTTPServer:
         )
 
     @staticmethod
-    def serve_file(file_path, content_type):
+    def serve_file(file_path, content_type, request_headers=None):
         """
         Serves the content of a file as a response.
 
+        Small files are cached in a module-level dict validated against
+        the file's mtime, so a hot static file costs one stat() instead
+        of a read per request; larger files come back as a FileResponse
+        and are streamed with sendfile(2) instead of being read into
+        memory. ETag/Last-Modified headers are emitted either way, and
+        when the request's If-None-Match matches, a bodyless 304 is
+        returned instead.
+
         Args:
             file_path (str): The path to the file to be served.
             content_type (str): The content type of the file.
+            request_headers (dict, optional): The request headers, used
+                for conditional If-None-Match handling.
 
         Returns:
             Response: The response object containing the file content.
@@ -315,9 +978,29 @@ class HTTPServer:
             Exception: If there is an error while reading the file.
         """
         try:
-            with open(file_path, "r") as file:
-                content = file.read()
-            return Response(content, headers={"Content-Type": content_type})
+            stat = os.stat(file_path)
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            headers = {
+                "Content-Type": content_type,
+                "ETag": etag,
+                "Last-Modified": time.strftime(
+                    "%a, %d %b %Y %H:%M:%S GMT", time.gmtime(stat.st_mtime)
+                ),
+            }
+            if request_headers and request_headers.get(_IF_NONE_MATCH) == etag:
+                return Response("", status_code=304, headers=headers)
+
+            if stat.st_size > _SENDFILE_THRESHOLD:
+                return FileResponse(file_path, content_type, headers=headers)
+
+            cached = _STATIC_CACHE.get(file_path)
+            if cached is not None and cached[0] == stat.st_mtime_ns:
+                content = cached[1]
+            else:
+                with open(file_path, "rb") as file:
+                    content = file.read()
+                _STATIC_CACHE[file_path] = (stat.st_mtime_ns, content)
+            return Response(content, headers=headers)
         except Exception as e:
             return Response({"error": str(e)}, status_code=500)
 
@@ -327,12 +1010,17 @@ class HTTPServer:
         Parse the given JSON string and return the corresponding Python object.
 
         Args:
-            body (str): The JSON string to be parsed.
+            body (str or bytes): The JSON document to be parsed.
 
         Returns:
             object: The Python object representing the parsed JSON, or None if parsing fails.
         """
         try:
+            if orjson is not None:
+                return orjson.loads(body)
             return json.loads(body)
-        except Exception:
+        except (TypeError, ValueError):
+            # Both parsers raise a ValueError subclass on malformed JSON
+            # and TypeError on non-str/bytes input; anything else is a
+            # real bug and should propagate.
             return None
\ No newline at end of file